@@ -11,6 +11,8 @@ from .specs import (
     Post,
     Update,
     Test,
+    check_value_base_type,
+    get_base_type_name,
     InvalidValueError,
     BadSchemaError,
 )
@@ -28,6 +30,8 @@ __all__ = (
     'Post',
     'Update',
     'Test',
+    'check_value_base_type',
+    'get_base_type_name',
     'InvalidValueError',
     'BadSchemaError',
 )
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Callable, Iterable, Any, Optional
+from typing import Callable, Iterable, Any, Optional, Union, Tuple, Sequence, List
 
 
 def repr_seq_str(seq: Iterable[Any], delim: str = ', ', key: Callable[[Any], Any] = lambda i: i):
@@ -7,27 +7,78 @@ def repr_seq_str(seq: Iterable[Any], delim: str = ', ', key: Callable[[Any], Any
 
 
 def indent_msg_lines(messages: Iterable[str]):
-    indented_lines = []
-    for m in messages:
-        indented_lines.append('\n   '.join(m.split('\n')))
-    return indented_lines
+    return [m.replace('\n', '\n   ') for m in messages]
+
+
+# A failure message is either a str, or a tuple of a str.format() template -- or a function returning the message --
+# and its arguments. Tuples are only formatted if the message is read, so invalid values do not pay for repr() and
+# nested error messages nobody looks at.
+FailureMessage = Union[str, Tuple[Any, ...]]
+
+
+def format_failure_message(message: FailureMessage) -> str:
+    if type(message) is str:
+        return message
+    template = message[0]
+    if type(template) is str:
+        return template.format(*message[1:])
+    return template(*message[1:])
 
 
 class InvalidValueError(Exception):
     """Base exception for any value that fails to validate or canonicalize"""
-    def __init__(self, msg: str, messages: Optional[Iterable[str]] = None):
-        if messages:
-            self.messages = messages
-            msg = msg + ':\n-- ' + '\n-- '.join(indent_msg_lines(messages))
-        else:
-            self.messages = [msg]
-        self.message = msg
-        self.error_count = len(self.messages)
-        Exception.__init__(self, msg)
+    def __init__(self, msg: FailureMessage, messages: Optional[Sequence[FailureMessage]] = None):
+        # msg may itself be a FailureMessage tuple, e.g. for hot failure paths whose exceptions are usually discarded
+        self._msg = msg
+        # copied, since checkers keep appending to their own list after a nested failure is caught
+        self._failure_messages = tuple(messages) if messages else None
+        self._messages = None
+        self._message = None
+        self.error_count = len(messages) if messages else 1
+        Exception.__init__(self)
+
+    @property
+    def messages(self) -> List[str]:
+        if self._messages is None:
+            if self._failure_messages:
+                self._messages = [format_failure_message(m) for m in self._failure_messages]
+            else:
+                self._messages = [format_failure_message(self._msg)]
+        return self._messages
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            if self._failure_messages:
+                messages = '\n-- '.join(indent_msg_lines(self.messages))
+                self._message = format_failure_message(self._msg) + ':\n-- ' + messages
+            else:
+                self._message = format_failure_message(self._msg)
+        return self._message
+
+    @property
+    def args(self) -> Tuple[str]:
+        # the message is formatted on first read, so args is too
+        return self.message,
+
+    @args.setter
+    def args(self, args: Tuple[Any, ...]):
+        # as for other exceptions, assigned args replace the message; messages and error_count are left as they were
+        args = tuple(args)
+        self._message = str(args[0]) if len(args) == 1 else str(args)
 
     def __str__(self):
         return self.message
 
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.message!r})'
+
+    def __reduce__(self):
+        # failure messages are formatted to plain strings, since callable templates may not be picklable
+        messages = list(self.messages) if self._failure_messages else None
+        # the formatted message is passed as state too, in case it was replaced by assigning args
+        return self.__class__, (format_failure_message(self._msg), messages), {'_message': self._message}
+
 
 class InvalidValueNoTypeMatch(InvalidValueError):
     """Exception for when there is explicitly no type match -- mostly used internally
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from typing import Optional, Any, Union, Callable, Sequence, Tuple
+from weakref import WeakValueDictionary
 
 from ._utils import InvalidValueError, BadSchemaError
 
@@ -13,6 +14,7 @@ Constraints = Optional[Union[Constraint, Sequence[Constraint]]]
 # types that can routinely be explicitly set to a false value and be meaningfully
 # different from empty/unset in the context of "data"
 _explicitly_falsifiable = (int, float, complex, bool)
+_explicitly_falsifiable_types = frozenset(_explicitly_falsifiable)
 
 
 def default_is_unset(value: Any) -> bool:
@@ -22,20 +24,61 @@ def default_is_unset(value: Any) -> bool:
     This is the default function used to decide if the default should be used
     instead of the value under validation
     """
-    return not value and not isinstance(value, _explicitly_falsifiable)
+    if value:
+        return False
+    # exact types are a set lookup; isinstance() is only needed for subclasses, e.g. IntEnum
+    return type(value) not in _explicitly_falsifiable_types and not isinstance(value, _explicitly_falsifiable)
 
 
 def canonicalize_constraints(constraints: Constraints) -> Tuple[Constraint, ...]:
+    """Convert a single Constraint or any iterable of Constraint to a tuple of (validator, message) tuples"""
     if not constraints:
-        return tuple()
-    if not isinstance(constraints[0], tuple):
-        constraints = (constraints,)
-    return constraints
+        return ()
+    if not isinstance(constraints, Sequence):
+        constraints = tuple(constraints)
+        if not constraints:
+            return ()
+    if callable(constraints[0]):
+        return (tuple(constraints),)
+    if type(constraints) is tuple and all(type(c) is tuple for c in constraints):
+        # already canonical, e.g. the constraints of a Spec being copied -- share the tuple rather than rebuilding it
+        return constraints
+    # each pair is frozen too, so a Spec given e.g. a list pair still hashes by value rather than identity
+    return tuple(c if type(c) is tuple else tuple(c) for c in constraints)
+
+
+# Specs shared by Spec.intern(), keyed by class and constructor arguments
+_interned_specs: WeakValueDictionary = WeakValueDictionary()
+
+
+def _typed_key(value: Any) -> Any:
+    """Get a key for `value` that also compares the types of it and the items of any tuple/frozenset it contains
+
+    Equal values of different types, like `1`, `1.0`, and `True`, are not interchangeable Spec arguments. Raises
+    TypeError if `value` is not Hashable.
+    """
+    value_type = type(value)
+    if value_type is tuple:
+        return value_type, tuple([_typed_key(v) for v in value])
+    if value_type is frozenset:
+        return value_type, frozenset([_typed_key(v) for v in value])
+    return value_type, value
 
 
 class Spec:
     """Abstract base class for all Spec / schema elements"""
+    __slots__ = (
+        'optional',
+        '_default',
+        '_default_is_callable',
+        '_is_unset',
+        '_constraints',
+        '_hash',
+        '__weakref__',
+    )
     _hash_props: Tuple[str] = ()
+    # subclasses accepting a `fail_fast` argument shadow this with a slot
+    fail_fast: bool = False
 
     def __init__(self,
                  optional: bool,
@@ -61,37 +104,70 @@ class Spec:
         """
         self.optional = optional
         self._default = default
+        self._default_is_callable = callable(default)
         self._is_unset = is_unset
         self._constraints = canonicalize_constraints(constraints)
         if optional:
             try:
-                d_value = self.default()
-                self._check_value(d_value)
+                # constraints apply to the checked value, as in check_value()
+                self.check_constraints(self._check_value(self.default()))
             except InvalidValueError as e:
                 raise BadSchemaError(f'Invalid schema, default value is spec-invalid: {e}')
-        self._base_kwds = (
-            ('optional', self.optional),
-            ('default', self._default),
-            ('is_unset', self._is_unset),
-            ('constraints', self._constraints),
-        )
-        self._base_hash_vals = (self.__class__, optional, default, is_unset, constraints)
+        # computed on first use, since most Specs are only used for validation and hashing walks the whole schema
         self._hash = None
 
-    def __hash__(self):
-        if self._hash is None:
-            self._hash = hash((
-                *self._base_hash_vals,
-                *(getattr(self, name) for name in self._hash_props)
+    def _compute_hash(self) -> int:
+        try:
+            return hash((
+                self.__class__,
+                self.optional,
+                self._default,
+                self._is_unset,
+                self._constraints,
+                self.fail_fast,
+                *[getattr(self, name) for name in self._hash_props],
             ))
-        return self._hash
+        except TypeError:
+            # unhashable schema elements (e.g. a list shorthand or mutable default) -- Spec equality is identity,
+            # so the identity hash is still consistent
+            return object.__hash__(self)
+
+    def __hash__(self):
+        h = self._hash
+        if h is None:
+            h = self._hash = self._compute_hash()
+        return h
+
+    @classmethod
+    def intern(cls, *args, **kwds) -> Spec:
+        """Get a shared instance of this Spec class constructed with the given arguments
+
+        Specs are not modified after construction, so code that would otherwise build identical Specs repeatedly (e.g.
+        per request) can share one instance and everything it precomputes. Instances are held weakly and are released
+        once no longer referenced elsewhere.
+
+        Arguments are matched by equality and type, so e.g. a `default` of `1`, `1.0`, and `True` each get their own
+        instance. Callables such as `is_unset`, `canonicalize`, and constraint functions only match the identical
+        object -- a new lambda on every call defeats interning. If any argument is not Hashable, a new un-shared
+        instance is returned.
+        """
+        try:
+            key = (cls, _typed_key(args), _typed_key(tuple(sorted(kwds.items()))))
+            return _interned_specs[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return cls(*args, **kwds)
+        spec = cls(*args, **kwds)
+        _interned_specs[key] = spec
+        return spec
 
     def default(self) -> Any:
         """Get the default value.
 
         Either returns the `default` constructor argument, or calls and reutnrs it if it's `callable()`
         """
-        if callable(self._default):
+        if self._default_is_callable:
             return self._default()
         else:
             return self._default
@@ -99,22 +175,32 @@ class Spec:
     def check_constraints(self, value: Any) -> None:
         """Check the passed value against any constraints passed to this Spec
 
-        Raises an `InvalidValueError` if invalid, otherwise returns None.
+        Raises an `InvalidValueError` if invalid, otherwise returns None. Unless `fail_fast` is set, every constraint is
+        checked so that all failure messages are reported.
         """
-        if not self._constraints:
+        constraints = self._constraints
+        if not constraints:
             return
-        if self._is_unset(value) and self.optional:
+        if self.optional and self._is_unset(value):
             return
-        failure_messages = []
-        for c, message in self._constraints:
+        if len(constraints) == 1:
+            c, message = constraints[0]
             result = c(value)
             if not result:
-                failure_messages.append(f'Constraint not met (return={result!r}): {message}')
+                raise InvalidValueError(('Constraint not met (return={!r}): {}', result, message))
+            return
+        failure_messages = None
+        for c, message in constraints:
+            result = c(value)
+            if not result:
+                # the list is only needed once a constraint fails, which is rare
+                if failure_messages is None:
+                    failure_messages = []
+                failure_messages.append(('Constraint not met (return={!r}): {}', result, message))
+                if self.fail_fast:
+                    break
         if failure_messages:
-            if len(self._constraints) == 1:
-                raise InvalidValueError(failure_messages[0])
-            else:
-                raise InvalidValueError('Does not meet value constraints', failure_messages)
+            raise InvalidValueError('Does not meet value constraints', failure_messages)
 
     def check_value(self, value: Any) -> Any:
         """Validate that a value conforms with the entire Spec. The primary interface to a schema.
@@ -124,27 +210,43 @@ class Spec:
 
         If invalid, raises an InvalidValueError.
         """
-        if self._is_unset(value) and self.optional:
+        if self.optional and self._is_unset(value):
             value = self.default()
         c_value = self._check_value(value)
-        self.check_constraints(c_value)
+        if self._constraints:
+            self.check_constraints(c_value)
         return c_value
 
     def _check_value(self, value):
         raise NotImplementedError()
 
+    def _get_value_checker(self) -> Callable[[Any], Any]:
+        """Get the cheapest callable equivalent to `check_value`, for checking values of a Spec embedded in another
+
+        The shape of a Spec is fixed after construction, so when there is no default to apply and no constraints,
+        `check_value` would only call `_check_value`, and that can be called directly instead.
+        """
+        if self.optional or self._constraints or type(self).check_value not in _wrapping_check_values:
+            return self.check_value
+        return self._check_value
+
     def type_name(self) -> str:
         raise NotImplementedError()
 
     def _set_default_kwds(self, kwds: dict):
-        for key, value in self._base_kwds:
-            kwds.setdefault(key, value)
+        kwds.setdefault('optional', self.optional)
+        kwds.setdefault('default', self._default)
+        kwds.setdefault('is_unset', self._is_unset)
+        kwds.setdefault('constraints', self._constraints)
 
     def copy(self, **kwds) -> Spec:
         """Create a copy of this Spec, optionally updating constructor keyword args"""
         self._set_default_kwds(kwds)
         for kwd in self._hash_props:
             kwds.setdefault(kwd, getattr(self, kwd))
+        if self.fail_fast:
+            # only passed when set, so subclasses whose __init__ does not accept it can still be copied
+            kwds.setdefault('fail_fast', True)
         return self.__class__(**kwds)
 
     def add_constraints(self, constraints: Constraints) -> Spec:
@@ -168,7 +270,10 @@ Canonicalize = Optional[Callable[[Any], Any]]
 
 class Canonicalizable(Spec, ABC):
     """Abstract base class for Spec that can be canonicalized"""
+    __slots__ = ('_canonicalize',)
     _canonicalization_invalid_exception: Exception = InvalidValueError
+    # True if canonicalize() is overridden, in which case it may alter values even without a `canonicalize` callable
+    _canonicalize_overridden: bool = False
 
     def __init__(self,
                  canonicalize: Canonicalize = None,
@@ -182,11 +287,22 @@ class Canonicalizable(Spec, ABC):
         """
         self._canonicalize = canonicalize
         Spec.__init__(self, optional, default, is_unset, constraints)
-        self._base_hash_vals = (*self._base_hash_vals, canonicalize)
-        self._base_kwds = (
-            *self._base_kwds,
-            ('canonicalize', canonicalize),
-        )
+
+    def __init_subclass__(cls, **kwds):
+        super().__init_subclass__(**kwds)
+        if 'canonicalize' in cls.__dict__:
+            cls._canonicalize_overridden = True
+
+    def _compute_hash(self) -> int:
+        h = Spec._compute_hash(self)
+        try:
+            return hash((h, self._canonicalize))
+        except TypeError:
+            return h
+
+    def _set_default_kwds(self, kwds: dict):
+        Spec._set_default_kwds(self, kwds)
+        kwds.setdefault('canonicalize', self._canonicalize)
 
     def canonicalize(self, value: Any) -> Any:
         """Attempt to canonicalize a value under validation"""
@@ -200,4 +316,16 @@ class Canonicalizable(Spec, ABC):
 
     def check_value(self, value: Any) -> Any:
         c_value = Spec.check_value(self, value)
+        if not self._canonicalize and not self._canonicalize_overridden:
+            return c_value
         return self.canonicalize(c_value)
+
+    def _get_value_checker(self) -> Callable[[Any], Any]:
+        if self._canonicalize or self._canonicalize_overridden:
+            return self.check_value
+        return Spec._get_value_checker(self)
+
+
+# check_value() implementations that only add defaults, constraints, and canonicalization around _check_value(). Spec
+# subclasses that inline those steps into their own check_value() add it here
+_wrapping_check_values = {Spec.check_value, Canonicalizable.check_value}
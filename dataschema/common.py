@@ -13,10 +13,11 @@ from .specs import (
     IterSpec,
 )
 
-optional_bool = Type(bool, optional=True)
-optional_str = Type(str, optional=True)
-optional_int = Type(int, optional=True)
-optional_float = Type(float, optional=True)
+# None is one of the types, so an unset value is None rather than a default of the wrong type
+optional_bool = TypeSpec((bool, None))
+optional_str = TypeSpec((str, None))
+optional_int = TypeSpec((int, None))
+optional_float = TypeSpec((float, None))
 
 user_integer = TypeSpec((int, CType(str, int)))
 user_float = TypeSpec((float, CType(str, float)))
@@ -42,9 +43,9 @@ port_number_constraint: Constraint = (
 )
 port_number = user_integer(constraints=port_number_constraint)
 
-_word_re = re.compile(r'^\w*$')
+_word_re = re.compile(r'\w*')
 word_constraint: Constraint = (
-    lambda s: bool(_word_re.match(s)),
+    lambda s: _word_re.fullmatch(s) is not None,
     'Must contain only word characters'
 )
 word_str = Type(str, constraints=word_constraint)
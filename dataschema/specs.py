@@ -1,6 +1,11 @@
 from __future__ import annotations
+import operator
 import typing
+from array import array
 from collections import abc
+from functools import partial
+from itertools import repeat
+from weakref import WeakValueDictionary
 from typing import (
     Optional,
     Any,
@@ -20,6 +25,7 @@ from ._utils import (
     InvalidValueError,
     InvalidValueNoTypeMatch,
     BadSchemaError,
+    FailureMessage,
 )
 from .base import (
     Spec,
@@ -28,39 +34,109 @@ from .base import (
     Constraints,
     Canonicalize,
     default_is_unset,
+    _wrapping_check_values,
 )
 
 SimpleType = Union[type, bool, type(None)]  # All types in this Union must also work with isinstance()
 BaseType = Union[SimpleType, Spec, list, set, dict]
 Types = Union[BaseType, Tuple[BaseType, ...]]
 
+# Values that are already canonical base types, for isinstance()
+_canonical_base_types = (Spec, *SimpleType.__args__)
+# Exact types of canonical base types, checked before isinstance(). Spec subclasses and metaclasses are added the first
+# time they are seen by canonicalize_base_type()
+_canonical_exact_types = {type, bool, type(None)}
+
 
 def canonicalize_base_type(t):
     """Return a Spec instance for list/set/dict/tuple and unmodified value for type/bool/Spec/None"""
 
-    if isinstance(t, (Spec, *SimpleType.__args__)):
+    t_type = type(t)
+    if t_type in _canonical_exact_types:
         return t
-    elif isinstance(t, tuple):
-        return TypeSpec(t)
-    elif isinstance(t, list):
-        return IterSpec(tuple(t))
-    elif isinstance(t, set):
-        return EnumSpec(t)
-    elif isinstance(t, dict):
-        return DictSpec(t)
-    else:
-        raise BadSchemaError(f'{t!r} is not a valid Type: must be type/bool/Spec/None/tuple/list/set/dict')
+    to_spec = _shorthand_specs.get(t_type)
+    if to_spec is not None:
+        return to_spec(t)
+    if isinstance(t, _canonical_base_types):
+        _canonical_exact_types.add(t_type)
+        return t
+    for shorthand_type, to_spec in _shorthand_specs.items():
+        if isinstance(t, shorthand_type):
+            return to_spec(t)
+    raise BadSchemaError(f'{t!r} is not a valid Type: must be type/bool/Spec/None/tuple/list/set/dict')
+
+
+def _is_base_type_key(key: Hashable) -> bool:
+    """Return True if canonicalize_base_type() accepts the Hashable `key`, without raising for the common value keys
+
+    Hashable keys cannot be the list/set/dict shorthands, so only tuples need to be looked into
+    """
+    if isinstance(key, _canonical_base_types):
+        return True
+    if isinstance(key, tuple):
+        return all(_is_base_type_key(t) for t in key)
+    return False
+
+
+# TypeSpecs built from the tuple shorthand, keyed by id() of the tuple. The tuple is kept in the entry so that its id
+# cannot be reused by another object while cached.
+_tuple_type_specs: Dict[int, Tuple[tuple, TypeSpec]] = {}
+_TUPLE_TYPE_SPECS_MAX = 256
+
+
+def _tuple_type_spec(t: tuple) -> TypeSpec:
+    entry = _tuple_type_specs.get(id(t))
+    if entry is not None and entry[0] is t:
+        return entry[1]
+    spec = _intern_shorthand(TypeSpec, t)
+    if len(_tuple_type_specs) >= _TUPLE_TYPE_SPECS_MAX:
+        _tuple_type_specs.clear()
+    _tuple_type_specs[id(t)] = (t, spec)
+    return spec
+
+
+def _intern_shorthand(spec_class: typing.Type[Spec], types: tuple) -> Spec:
+    """Build the Spec for a tuple/list shorthand, sharing one instance between equal shorthands
+
+    Only shorthands made of already-canonical base types are shared: they are always hashable, and e.g. `(True,)` and
+    the invalid `(1,)` cannot be confused for one another
+    """
+    if all(isinstance(t, _canonical_base_types) for t in types):
+        return spec_class.intern(types)
+    return spec_class(types)
+
+
+# EnumSpecs built from the set shorthand, keyed by the set's values along with their classes, since e.g. `{1}` and
+# `{True}` are equal sets but name different enums
+_set_enum_specs: WeakValueDictionary = WeakValueDictionary()
+
+
+def _set_enum_spec(t: set) -> EnumSpec:
+    key = frozenset([(v.__class__, v) for v in t])
+    spec = _set_enum_specs.get(key)
+    if spec is None:
+        spec = _set_enum_specs[key] = EnumSpec(t)
+    return spec
+
+
+# Builds the Spec for each shorthand schema type. canonicalize_base_type() looks these up by exact type first, and
+# only falls back to isinstance() for subclasses
+_shorthand_specs: Dict[type, Callable[[Any], Spec]] = {
+    tuple: _tuple_type_spec,
+    list: lambda t: _intern_shorthand(IterSpec, tuple(t)),
+    set: _set_enum_spec,
+    dict: lambda t: DictSpec(t),
+}
 
 
 def canonicalize_types(types):
     """Convert a Types (possibly one BaseType) to a tuple of canonicalized base types"""
-    c_types = []
     if isinstance(types, tuple):
-        for t in types:
-            c_types.append(canonicalize_base_type(t))
-    else:
-        c_types.append(canonicalize_base_type(types))
-    return tuple(c_types)
+        if type(types) is tuple and all(isinstance(t, _canonical_base_types) for t in types):
+            # already canonical, e.g. the `types` of another TypeSpec/IterSpec
+            return types
+        return tuple([canonicalize_base_type(t) for t in types])
+    return (canonicalize_base_type(types),)
 
 
 def get_base_type_name(t: Any):
@@ -90,23 +166,181 @@ def must_be_msg(types: Any):
         return 'Must be one of: ' + ', '.join(get_types_names(types))
 
 
-def check_value_base_type(t: BaseType, value: Any):
-    """Validate that value conforms with the BaseType and return the canonicalized value if so
+BaseTypeChecker = Callable[[Any, Any], Any]
 
-    Raises InvalidValueError if the value is invalid
+
+def _check_value_type(t: type, value: Any):
+    # an exact type match is a pointer comparison; isinstance() is only needed for subclasses
+    if type(value) is t or isinstance(value, t):
+        return value
+    raise InvalidValueNoTypeMatch('Must be ' + t.__name__)
+
+
+def _check_value_identical(t: Union[bool, None], value: Any):
+    if value is t:
+        return value
+    raise InvalidValueNoTypeMatch('Must be ' + repr(t))
+
+
+def _check_value_spec(t: Spec, value: Any):
+    return t.check_value(value)
+
+
+def _check_value_type_spec(t: Union[Type, EnumSpec], value: Any):
+    # same as _check_value_spec; lets type unions skip a non-matching Type/EnumSpec by its _is_type_match(), without
+    # an exception
+    return t.check_value(value)
+
+
+# Maps type(t) of a canonicalized BaseType to the function checking values against it. Spec subclasses and
+# metaclasses are added the first time they are seen by get_base_type_checker()
+_base_type_checkers: Dict[type, BaseTypeChecker] = {
+    type: _check_value_type,
+    bool: _check_value_identical,
+    type(None): _check_value_identical,
+}
+
+
+def get_base_type_checker(t: Any) -> BaseTypeChecker:
+    """Get the function that checks a value against a canonicalized BaseType
+
+    The returned function accepts `(t, value)` and behaves like `check_value_base_type`
     """
-    t = canonicalize_base_type(t)
-    if isinstance(t, type):
-        if isinstance(value, t):
-            return value
+    t_type = type(t)
+    try:
+        return _base_type_checkers[t_type]
+    except KeyError:
+        pass
+    if ((isinstance(t, Type) and t_type._check_value is Type._check_value and t_type.check_value is Type.check_value)
+            or (isinstance(t, EnumSpec) and t_type._check_value is EnumSpec._check_value
+                and t_type.check_value is EnumSpec.check_value)):
+        # _is_type_match() only mirrors the stock checks, so subclasses changing them are tried like any other Spec
+        checker = _check_value_type_spec
     elif isinstance(t, Spec):
-        return t.check_value(value)
-    elif isinstance(t, bool) or t is None:
-        if value is t:
-            return value
+        checker = _check_value_spec
+    elif isinstance(t, type):
+        checker = _check_value_type
     else:
         raise BadSchemaError(f'Invalid schema definition -- unknown type spec value {t!r}')
-    raise InvalidValueNoTypeMatch(must_be_msg(t))
+    _base_type_checkers[t_type] = checker
+    return checker
+
+
+def check_value_base_type(t: BaseType, value: Any):
+    """Validate that value conforms with the BaseType and return the canonicalized value if so
+
+    Raises InvalidValueError if the value is invalid
+    """
+    if type(t) is type:
+        return _check_value_type(t, value)
+    return _check_value_base_type_canon(canonicalize_base_type(t), value)
+
+
+def _check_value_base_type_canon(t: Any, value: Any):
+    """`check_value_base_type` for an already canonicalized BaseType"""
+    return get_base_type_checker(t)(t, value)
+
+
+ValueChecker = Callable[[Any], Any]
+
+
+def get_value_checker(t: Any) -> ValueChecker:
+    """Get a function accepting only the value, checking it against a canonicalized BaseType
+
+    Specs give their bound `check_value` (or the cheaper equivalent from `_get_value_checker`), avoiding the extra call
+    through a `BaseTypeChecker`
+    """
+    checker = get_base_type_checker(t)
+    if checker is _check_value_spec or checker is _check_value_type_spec:
+        return t._get_value_checker()
+    return partial(checker, t)
+
+
+TypeCheckers = Tuple[Tuple[Any, BaseTypeChecker], ...]
+
+
+def get_type_checkers(c_types: Tuple[Any, ...]) -> TypeCheckers:
+    """Pair each canonicalized base type with its checker function, for use with `check_value_type_checkers`"""
+    return tuple((t, get_base_type_checker(t)) for t in c_types)
+
+
+def _first_match_for_type(c_types: Tuple[Any, ...], value_type: type) -> Any:
+    """Get the first of the canonicalized types matched by every value of exactly `value_type`
+
+    Returns _MISSING if no type matches, or if which one matches first depends on the value itself, e.g. an EnumSpec or
+    an optional Type ahead of the matching type.
+    """
+    for t in c_types:
+        if isinstance(t, type):
+            if issubclass(value_type, t):
+                return t
+        elif t is None or type(t) is bool:
+            if value_type is type(t):
+                # None is the only NoneType value, but True/False only match one of the bool values
+                return t if t is None else _MISSING
+        elif type(t) is Type and t._base_type_is_class:
+            if issubclass(value_type, t.base_type):
+                return t
+            if t.optional:
+                return _MISSING
+        else:
+            return _MISSING
+    return _MISSING
+
+
+def get_type_dispatch(c_types: Tuple[Any, ...]) -> Tuple[typing.FrozenSet[type], Dict[type, ValueChecker]]:
+    """Get the value types that can be checked by their exact type, without trying the canonicalized types in order
+
+    Returns the set of exact value types that are valid and left unchanged, and a map of exact value types to the
+    checker of the plain `Type` that would match them first.
+    """
+    value_types = set()
+    for t in c_types:
+        if isinstance(t, type):
+            value_types.add(t)
+        elif t is None:
+            value_types.add(type(None))
+        elif type(t) is Type and t._base_type_is_class:
+            value_types.add(t.base_type)
+    exact_types = set()
+    type_dispatch = {}
+    for value_type in value_types:
+        t = _first_match_for_type(c_types, value_type)
+        if t is _MISSING:
+            continue
+        if isinstance(t, Type):
+            type_dispatch[value_type] = t._get_value_checker()
+        else:
+            exact_types.add(value_type)
+    return frozenset(exact_types), type_dispatch
+
+
+def check_value_type_checkers(type_checkers: TypeCheckers, value: Any, no_match_msg: FailureMessage):
+    """Like `check_value_types` using checkers precomputed for the canonicalized types by `get_type_checkers`
+
+    `no_match_msg` is the message used if no type matches, typically the precomputed `must_be_msg()` of the types
+    """
+    for t, checker in type_checkers:
+        # plain types, True/False/None, Type and EnumSpec are matched inline, so a non-matching one raises nothing
+        if checker is _check_value_type:
+            if type(value) is t or isinstance(value, t):
+                return value
+        elif checker is _check_value_identical:
+            if value is t:
+                return value
+        elif checker is _check_value_type_spec:
+            if t._is_type_match(value):
+                # a CType may still fail to canonicalize, making it a non-match after all
+                try:
+                    return t.check_value(value)
+                except InvalidValueNoTypeMatch:
+                    pass
+        else:
+            try:
+                return checker(t, value)
+            except InvalidValueNoTypeMatch:
+                pass
+    raise InvalidValueNoTypeMatch(no_match_msg)
 
 
 def check_value_types(types: Types, value: Any):
@@ -114,17 +348,19 @@ def check_value_types(types: Types, value: Any):
 
     Raises InvalidValueError if the value is invalid
     """
-    types = canonicalize_types(types)
-    for t in types:
-        try:
-            return check_value_base_type(t, value)
-        except InvalidValueNoTypeMatch:
-            pass
-    raise InvalidValueNoTypeMatch(must_be_msg(types))
+    return _check_value_types_canon(canonicalize_types(types), value)
+
+
+def _check_value_types_canon(c_types: Tuple[Any, ...], value: Any):
+    """`check_value_types` for types that are already a tuple of canonicalized base types"""
+    if len(c_types) == 1 and type(c_types[0]) is type:
+        return _check_value_type(c_types[0], value)
+    # the message is only built if no type matches
+    return check_value_type_checkers(get_type_checkers(c_types), value, (must_be_msg, c_types))
 
 
-def simple_is_unset(value: Any) -> bool:
-    return not value
+# Equivalent to `lambda value: not value`, without a Python-level call per checked value
+simple_is_unset: Validator = operator.not_
 
 
 class Type(Canonicalizable):
@@ -139,6 +375,7 @@ class Type(Canonicalizable):
     The wrapped simple type is the required first argument to the constructor. If no additional arguments are passed,
     _it should not be used_.
     """
+    __slots__ = ('base_type', 'fail_fast', '_base_type_is_class', '_must_be_msg')
     _hash_props = ('base_type',)
 
     def __init__(self,
@@ -147,23 +384,70 @@ class Type(Canonicalizable):
                  optional: bool = False,
                  default: Any = None,
                  is_unset: Validator = default_is_unset,
-                 constraints: Constraints = None):
+                 constraints: Constraints = None,
+                 fail_fast: bool = False):
         """
         ---
         base_type: The single wrapped type, bool value, or None
+        fail_fast: Set to True to stop checking constraints at the first one that is not met
         """
         if not isinstance(base_type, SimpleType.__args__):
             raise BadSchemaError('Type may only be used with one of: type/True/False/None')
         self.base_type = base_type
+        self.fail_fast = fail_fast
+        self._base_type_is_class = isinstance(base_type, type)
+        self._must_be_msg = must_be_msg(base_type)
         Canonicalizable.__init__(self, canonicalize, optional, default, is_unset, constraints)
 
+    def __init_subclass__(cls, **kwds):
+        super().__init_subclass__(**kwds)
+        if cls._check_value is not Type._check_value and cls.check_value is Type.check_value:
+            # check_value() inlines Type._check_value(), so a subclass overriding only the hook needs the generic steps
+            cls.check_value = Canonicalizable.check_value
+
+    def check_value(self, value: Any) -> Any:
+        # Same steps as Canonicalizable.check_value() and _check_value(), inlined since Type is typically checked once
+        # per element of an IterSpec/SeqSpec/DictSpec
+        if self.optional and self._is_unset(value):
+            value = self.default()
+        base_type = self.base_type
+        if self._base_type_is_class:
+            if type(value) is not base_type and not isinstance(value, base_type):
+                raise InvalidValueNoTypeMatch(self._must_be_msg)
+        elif value is not base_type:
+            raise InvalidValueNoTypeMatch(self._must_be_msg)
+        if self._constraints:
+            self.check_constraints(value)
+        if not self._canonicalize and not self._canonicalize_overridden:
+            return value
+        return self.canonicalize(value)
+
     def _check_value(self, value):
-        return check_value_base_type(self.base_type, value)
+        base_type = self.base_type
+        if self._base_type_is_class:
+            if type(value) is base_type or isinstance(value, base_type):
+                return value
+        elif value is base_type:
+            return value
+        raise InvalidValueNoTypeMatch(self._must_be_msg)
+
+    def _is_type_match(self, value: Any) -> bool:
+        """Return False, without raising, if check_value() would reject the value as not identifying as this Type"""
+        base_type = self.base_type
+        if self._base_type_is_class:
+            if type(value) is base_type or isinstance(value, base_type):
+                return True
+        elif value is base_type:
+            return True
+        return self.optional and self._is_unset(value)
 
     def type_name(self) -> str:
         return get_base_type_name(self.base_type)
 
 
+_wrapping_check_values.add(Type.check_value)
+
+
 class CType(Type):
     """
     `CType` is just like `Type`, with the exception being with canonicalization and type identity.
@@ -181,6 +465,7 @@ class CType(Type):
     int(), thereby invalidating the TypeSpec before the EnumSpec is checked. Using CType(str, int) would prevent
     this because 'foo' would not identify as the Type.
     """
+    __slots__ = ()
     _canonicalization_invalid_exception: Exception = InvalidValueNoTypeMatch
 
 
@@ -190,6 +475,7 @@ class EnumSpec(Canonicalizable):
     Values may be any type, but must be Hashable.
     Capable of value canonicalization.
     """
+    __slots__ = ('values', '_canonical_values', '_type_name', '_must_be_msg')
     _hash_props: Tuple[str] = ('values',)
 
     def __init__(self,
@@ -199,20 +485,83 @@ class EnumSpec(Canonicalizable):
                  optional: bool = False,
                  is_unset: Validator = simple_is_unset,
                  default: Any = None):
+        # materialize once so a one-shot iterable isn't consumed by the membership tests below
+        values = tuple(dict.fromkeys(values))
         if optional and None not in values:
-            values = [*values, None]
+            values = (*values, None)
         optional = None in values
         self.values = frozenset(values)
+        self._canonical_values = {}
+        self._type_name = 'enum=' + repr_seq_str(values, '/')
+        self._must_be_msg = f'Must match {self._type_name}'
         Canonicalizable.__init__(self, canonicalize, optional, default, is_unset, constraints)
 
+    def __init_subclass__(cls, **kwds):
+        super().__init_subclass__(**kwds)
+        if cls._check_value is not EnumSpec._check_value and cls.check_value is EnumSpec.check_value:
+            # as for Type, a subclass overriding only the _check_value() hook needs the generic steps
+            cls.check_value = Canonicalizable.check_value
+
+    def check_value(self, value: Any) -> Any:
+        # Same steps as Canonicalizable.check_value() and _check_value(), inlined as for Type
+        if self.optional and self._is_unset(value):
+            value = self.default()
+        try:
+            is_value = value in self.values
+        except TypeError:
+            # unhashable, so cannot be one of the values
+            is_value = False
+        if not is_value:
+            raise InvalidValueNoTypeMatch(self._must_be_msg)
+        if self._constraints:
+            self.check_constraints(value)
+        if not self._canonicalize and not self._canonicalize_overridden:
+            return value
+        return self.canonicalize(value)
+
     def _check_value(self, value):
-        if value in self.values:
+        try:
+            if value in self.values:
+                return value
+        except TypeError:
+            # unhashable, so cannot be one of the values
+            pass
+        raise InvalidValueNoTypeMatch(self._must_be_msg)
+
+    def _is_type_match(self, value: Any) -> bool:
+        """Return False, without raising, if check_value() would reject the value as not one of the values"""
+        try:
+            if value in self.values:
+                return True
+        except TypeError:
+            pass
+        return self.optional and self._is_unset(value)
+
+    def canonicalize(self, value: Any) -> Any:
+        """Canonicalize a valid enum value, memoizing immutable results
+
+        Only enumerated values reach canonicalization, so the memo is bounded by the size of the enum. Values are keyed
+        along with their class since e.g. `1` and `True` are equal but may canonicalize differently.
+        """
+        if not self._canonicalize:
             return value
-        else:
-            raise InvalidValueNoTypeMatch(f'Must match {self.type_name()}')
+        key = (value.__class__, value)
+        c_value = self._canonical_values.get(key, _MISSING)
+        if c_value is not _MISSING:
+            return c_value
+        c_value = Canonicalizable.canonicalize(self, value)
+        # don't share mutable results between calls, even hashable ones such as most class instances
+        if _is_immutable_default(c_value):
+            self._canonical_values[key] = c_value
+        return c_value
 
     def type_name(self) -> str:
-        return 'enum=' + repr_seq_str(self.values, '/')
+        return self._type_name
+
+
+_wrapping_check_values.add(EnumSpec.check_value)
+# EnumSpec.canonicalize() only adds a memo, and returns values unchanged without a `canonicalize` callable
+EnumSpec._canonicalize_overridden = False
 
 
 class TypeSpec(Spec):
@@ -222,6 +571,17 @@ class TypeSpec(Spec):
 
     Not capable of value canonicalization. Embed a Type/EnumSpec for a specific type if canonicalization is needed.
     """
+    __slots__ = (
+        'types',
+        '_type_checkers',
+        '_single_type',
+        '_single_type_checker',
+        '_type_name',
+        '_must_be_msg',
+        '_exact_types',
+        '_type_dispatch',
+        '_plain_types',
+    )
     _hash_props: Tuple[str] = ('types',)
 
     def __init__(self,
@@ -235,17 +595,60 @@ class TypeSpec(Spec):
             types = (*types, None)
         optional = None in types
         self.types = types
+        self._type_checkers = get_type_checkers(types)
+        # Specs are not modified after construction, so names are built once rather than walking nested Specs again
+        self._type_name = '/'.join(get_types_names(types))
+        self._must_be_msg = must_be_msg(types)
+        if len(types) == 1:
+            self._single_type, self._single_type_checker = self._type_checkers[0]
+        else:
+            self._single_type = self._single_type_checker = None
+        self._exact_types, self._type_dispatch = get_type_dispatch(types)
+        if all(isinstance(t, type) or t is None for t in types):
+            # a union of only classes (None is only ever an instance of NoneType) is a single isinstance() call
+            self._plain_types = tuple(type(None) if t is None else t for t in types)
+        else:
+            self._plain_types = None
         Spec.__init__(self, optional, default, is_unset, constraints)
 
     def _check_value(self, value):
-        return check_value_types(self.types, value)
+        if type(value) in self._exact_types:
+            return value
+        if self._plain_types is not None:
+            if isinstance(value, self._plain_types):
+                return value
+            raise InvalidValueNoTypeMatch(self._must_be_msg)
+        if self._type_dispatch:
+            check = self._type_dispatch.get(type(value))
+            if check is not None:
+                return check(value)
+        if self._single_type_checker is not None:
+            try:
+                return self._single_type_checker(self._single_type, value)
+            except InvalidValueNoTypeMatch:
+                raise InvalidValueNoTypeMatch(self._must_be_msg)
+        return check_value_type_checkers(self._type_checkers, value, self._must_be_msg)
 
     def type_name(self) -> str:
-        return '/'.join(get_types_names(self.types))
+        return self._type_name
 
 
 IterableType = typing.Type[Iterable]
 
+# Checked by exact type before falling back to the (much slower) ABC isinstance() checks
+_builtin_sequences = frozenset((list, tuple, str, range, bytes, bytearray, array))
+_builtin_iterables = _builtin_sequences | {set, frozenset, dict, type({}.keys()), type({}.values()), type({}.items())}
+
+# Builtin iterables whose elements are always exactly int
+_int_iterables = frozenset((range, bytes, bytearray))
+
+# Element type of an array.array for each typecode, so a typed array can be checked once rather than per element
+_array_item_types = {
+    **dict.fromkeys('bBhHiIlLqQ', int),
+    **dict.fromkeys('fd', float),
+    **dict.fromkeys('uw', str),
+}
+
 
 class IterSpec(Spec):
     """Spec for an iterable. Behaves like TypeSpec on each element of an iterable value, with the key
@@ -256,7 +659,21 @@ class IterSpec(Spec):
 
     Not directly capable of value canonicalization besides ensuring the desired Iterable type. Embed Type/EnumSpec if
     individual list element values must be canonicalized.
+
+    By default, every invalid element is reported. Pass `fail_fast=True` to stop at the first invalid element when
+    only validity matters.
     """
+    __slots__ = (
+        'types',
+        'c_type',
+        'fail_fast',
+        '_type_checkers',
+        '_must_be_msg',
+        '_plain_types',
+        '_plain_constraints',
+        '_ints_ok',
+        '_value_checker',
+    )
     _hash_props: Tuple[str] = ('types', 'c_type')
 
     def __init__(self,
@@ -265,24 +682,101 @@ class IterSpec(Spec):
                  optional: bool = False,
                  default: Any = list,
                  is_unset: Validator = simple_is_unset,
-                 constraints: Constraints = None):
+                 constraints: Constraints = None,
+                 fail_fast: bool = False):
         self.types = canonicalize_types(types)
         self.c_type = c_type
+        self.fail_fast = fail_fast
+        self._type_checkers = get_type_checkers(self.types)
+        self._must_be_msg = must_be_msg(self.types)
+        self._plain_constraints = ()
+        if all(isinstance(t, type) for t in self.types):
+            # isinstance() target for the fast path: the type itself, or the tuple when several plain types are allowed
+            self._plain_types = self.types[0] if len(self.types) == 1 else self.types
+        elif len(self.types) == 1 and self._is_plain_constrained_type(self.types[0]):
+            # a Type that only adds constraints: check the type, then each constraint over all elements at once
+            self._plain_types = self.types[0].base_type
+            self._plain_constraints = self.types[0]._constraints
+        else:
+            self._plain_types = None
+        self._ints_ok = self._plain_types is not None and issubclass(int, self._plain_types)
+        if len(self.types) == 1:
+            self._value_checker = get_value_checker(self.types[0])
+        else:
+            self._value_checker = partial(
+                check_value_type_checkers, self._type_checkers, no_match_msg=self._must_be_msg
+            )
         Spec.__init__(self, optional, default, is_unset, constraints)
 
     def _check_value(self, value):
-        if not isinstance(value, abc.Iterable):
+        if type(value) not in _builtin_iterables and not isinstance(value, abc.Iterable):
             raise InvalidValueNoTypeMatch(f'Must be iterable')
 
-        c_values = []
+        if type(value) is array and self._plain_types is not None:
+            if issubclass(_array_item_types[value.typecode], self._plain_types):
+                values = value.tolist()
+                if all(all(map(validator, values)) for validator, _ in self._plain_constraints):
+                    return self._finalize(values)
+
+        # Fast paths check every element in one pass and produce the result list directly. Values are materialized
+        # first so that, if any element is invalid, the loop below can go over them again to collect messages.
+        values = list(value)
+        start = 0
         failure_messages = []
-        for i, l_value in enumerate(value):
+        if self._plain_types is not None:
+            # no element is altered, so they can all be type checked with builtins -- or not at all when the container
+            # only ever holds ints -- and then each constraint of a plain Type can be mapped over all of them
+            if ((self._ints_ok and type(value) in _int_iterables)
+                    or all(map(isinstance, values, repeat(self._plain_types)))):
+                if all(all(map(validator, values)) for validator, _ in self._plain_constraints):
+                    return self._finalize(values)
+        else:
+            # canonicalizing an element again would repeat its side effects, and nested specs would each check their
+            # own elements again, so on failure the loop below carries on after the failing element
+            check = self._value_checker
+            remaining = iter(values)
             try:
-                c_values.append(check_value_types(self.types, l_value))
+                c_values = [check(l_value) for l_value in remaining]
             except InvalidValueError as e:
-                failure_messages.append(f'Index {i} is invalid: {e}')
+                start = len(values) - operator.length_hint(remaining)
+                if isinstance(e, InvalidValueNoTypeMatch):
+                    # reported like check_value_type_checkers() reports an element matching none of the types
+                    e = InvalidValueNoTypeMatch(self._must_be_msg)
+                failure_messages.append(('Index {} is invalid: {}', start - 1, e))
+            else:
+                return self._finalize(c_values)
+
+        c_values = []
+        if not (failure_messages and self.fail_fast):
+            type_checkers = self._type_checkers
+            must_be = self._must_be_msg
+            for i in range(start, len(values)):
+                try:
+                    c_values.append(check_value_type_checkers(type_checkers, values[i], must_be))
+                except InvalidValueError as e:
+                    failure_messages.append(('Index {} is invalid: {}', i, e))
+                    if self.fail_fast:
+                        break
         if failure_messages:
             raise InvalidValueError('Items do not conform with iterable spec', failure_messages)
+        return self._finalize(c_values)
+
+    @staticmethod
+    def _is_plain_constrained_type(t: Any) -> bool:
+        """Return True if `t` is a Type of a class that leaves values unchanged, and only has constraints to check"""
+        return (
+            isinstance(t, Type)
+            and type(t).check_value is Type.check_value
+            and t._base_type_is_class
+            and not t.optional
+            and not t._canonicalize
+            and not t._canonicalize_overridden
+        )
+
+    def _finalize(self, c_values: list) -> Iterable:
+        # c_values is always a new list, so it can be returned as-is rather than copied into another list
+        if self.c_type is list:
+            return c_values
         return self.c_type(c_values)
 
     def type_name(self) -> str:
@@ -297,6 +791,7 @@ class SeqSpec(Spec):
 
     Does not support variable-length sequences. `type_sequence` and a value under validation must have the same length.
     """
+    __slots__ = ('type_sequence', 'c_type', '_value_checkers', '_type_name')
     _hash_props: Tuple[str] = ('type_sequence', 'c_type')
 
     def __init__(self,
@@ -307,8 +802,10 @@ class SeqSpec(Spec):
                  is_unset: Validator = simple_is_unset,
                  constraints: Constraints = None,
                  auto_optional: bool = False):
-        self.type_sequence = type_sequence
+        self.type_sequence = tuple(type_sequence)
         self.c_type = c_type
+        self._value_checkers = tuple(get_value_checker(canonicalize_base_type(t)) for t in self.type_sequence)
+        self._type_name = 'sequence(' + ', '.join(get_types_names(self.type_sequence)) + ')'
 
         if auto_optional:
             if optional or default is not list:
@@ -334,27 +831,52 @@ class SeqSpec(Spec):
         return self.c_type(default_seq)
 
     def type_name(self):
-        return 'sequence(' + ', '.join(get_types_names(self.type_sequence)) + ')'
+        return self._type_name
 
     def _check_value(self, value):
-        if not isinstance(value, abc.Sequence):
+        if type(value) not in _builtin_sequences and not isinstance(value, abc.Sequence):
             raise InvalidValueNoTypeMatch(f'Must be Sequence type')
 
         seq_len = len(self.type_sequence)
         if len(value) != seq_len:
             raise InvalidValueError(f'Sequence must have exactly {seq_len} elements')
 
-        c_values = []
-        failure_messages = []
-        for i, spec in enumerate(self.type_sequence):
-            s_value = value[i]
+        # the length is fixed, so the common all-valid case is a single comprehension; on a failure, the loop below
+        # carries on after the failing element to collect every message, without checking any element twice
+        checkers = self._value_checkers
+        remaining = iter(checkers)
+        try:
+            c_values = [check(s_value) for check, s_value in zip(remaining, value)]
+        except InvalidValueError as e:
+            start = seq_len - operator.length_hint(remaining)
+            failure_messages = [('Sequence index {} is invalid: {}', start - 1, e)]
+        else:
+            return self.c_type(c_values)
+
+        for i in range(start, seq_len):
             try:
-                c_values.append(check_value_base_type(spec, s_value))
+                checkers[i](value[i])
             except InvalidValueError as e:
-                failure_messages.append(f'Sequence index {i} is invalid: {str(e)}')
-        if failure_messages:
-            raise InvalidValueError('Sequence does not conform with spec', failure_messages)
-        return self.c_type(c_values)
+                failure_messages.append(('Sequence index {} is invalid: {}', i, e))
+        raise InvalidValueError('Sequence does not conform with spec', failure_messages)
+
+
+# Returned by Mapping.get() for keys that are not present in the mapping under validation
+_MISSING = object()
+
+# Checked defaults of these types can be shared between every mapping missing the key
+_immutable_default_types = frozenset((int, float, complex, bool, str, bytes, type(None)))
+_immutable_container_types = frozenset((tuple, frozenset))
+
+
+def _is_immutable_default(value: Any) -> bool:
+    """Return True if a checked default can be shared, i.e. it is immutable all the way down"""
+    value_type = type(value)
+    if value_type in _immutable_default_types:
+        return True
+    if value_type in _immutable_container_types:
+        return all(_is_immutable_default(item) for item in value)
+    return False
 
 
 RefKeys = Tuple[Hashable, ...]
@@ -363,12 +885,16 @@ RefTest = Callable[..., bool]
 
 
 class Post:
+    __slots__ = ('ref_keys', '_hash', '_hash_vals', '_ref_getter')
+
     def __init__(self, ref_keys: RefKeys):
         if not ref_keys:
             raise BadSchemaError('At least one reference key must be specified for Update/Post')
         self.ref_keys = ref_keys
         self._hash = None
         self._hash_vals = ()
+        # fetches every ref value in one call
+        self._ref_getter = operator.itemgetter(*ref_keys)
 
     def __hash__(self):
         if self._hash is None:
@@ -378,14 +904,23 @@ class Post:
     def evaluate(self, c_mapping: dict) -> None:
         raise NotImplementedError()
 
-    def _get_ref_values(self, c_mapping: dict) -> List:
+    def _get_ref_values(self, c_mapping: dict) -> Sequence:
+        try:
+            ref_values = self._ref_getter(c_mapping)
+        except KeyError:
+            pass
+        else:
+            # itemgetter() of a single key gives the bare value
+            return ref_values if len(self.ref_keys) > 1 else (ref_values,)
+        # find every missing key for the message
         ref_values = []
         missing_ref_keys = []
         for key in self.ref_keys:
-            try:
-                ref_values.append(c_mapping[key])
-            except KeyError:
+            value = c_mapping.get(key, _MISSING)
+            if value is _MISSING:
                 missing_ref_keys.append(repr(key))
+            else:
+                ref_values.append(value)
         if missing_ref_keys:
             missing_ref_keys = ', '.join(missing_ref_keys)
             raise InvalidValueError(f'Missing ref_keys {missing_ref_keys}')
@@ -397,6 +932,8 @@ def default_gate(*_) -> bool:
 
 
 class Update(Post):
+    __slots__ = ('update', 'gate')
+
     def __init__(self, *ref_keys,
                  update: RefUpdate,
                  gate: RefTest = default_gate):
@@ -412,6 +949,8 @@ class Update(Post):
 
 
 class Test(Post):
+    __slots__ = ('test', 'message')
+
     def __init__(self, *ref_keys,
                  test: RefTest,
                  message: str):
@@ -427,9 +966,18 @@ class Test(Post):
 
 
 class ConditionalDictSpec:
-    value_condition_specs: Dict[Hashable, DictSpec] = {}
-    apply_default_spec: bool = False
-    optional: bool = False
+    __slots__ = (
+        'value_condition_specs',
+        'apply_default_spec',
+        'optional',
+        'default_spec',
+        '_default',
+        '_must_be_msg',
+        '_hash',
+    )
+    value_condition_specs: Dict[Hashable, DictSpec]
+    apply_default_spec: bool
+    optional: bool
 
     def __init__(self,
                  value_condition_specs: Mapping[Hashable, Union[Mapping, DictSpec]],
@@ -456,15 +1004,18 @@ class ConditionalDictSpec:
         self.apply_default_spec = apply_default_spec
         self.optional = optional
         self._default = default
-        self._hash = hash((
-            ConditionalDictSpec,
-            tuple(value_condition_specs.items()),
-            apply_default_spec,
-            optional,
-            default,
-        ))
+        self._must_be_msg = must_be_msg(tuple(value_condition_specs.keys()))
+        self._hash = None
 
     def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((
+                ConditionalDictSpec,
+                tuple(self.value_condition_specs.items()),
+                self.apply_default_spec,
+                self.optional,
+                self._default,
+            ))
         return self._hash
 
     def default(self, checker):
@@ -473,14 +1024,14 @@ class ConditionalDictSpec:
         return self._default
 
     def check_value(self, checker, value):
+        value_spec = self.value_condition_specs.get(value)
+        if value_spec is None:
+            raise InvalidValueError(self._must_be_msg)
         try:
-            value_spec = self.value_condition_specs[value]
             checker.check_dict_spec(value_spec, unhandled_ok=True)
-            return value
-        except KeyError:
-            raise InvalidValueError(must_be_msg(tuple(self.value_condition_specs.keys())))
         except InvalidValueError as e:
             raise InvalidValueError(f'Does not conform with conditional spec for value {value!r}: {e}')
+        return value
 
 
 DictSpecValue = Union[Types, ConditionalDictSpec]
@@ -489,17 +1040,34 @@ DictItemTuple = Tuple[DictItemPair]
 DictSchema = Optional[Mapping[DictItemPair]]
 IterableSchema = Optional[Iterable[DictItemTuple]]
 PostProcessing = Optional[Iterable[Post]]
+ValueKeyRecord = Tuple[Hashable, Any, Optional[ValueChecker], bool, Any]
 
 
 class DictSpec(Spec):
     """
     Define a schema for a dictionary or other Mapping type
     """
-    value_key_specs: Tuple[DictItemTuple, ...] = ()
-    type_key_specs: Tuple[DictItemTuple, ...] = ()
-    post: Tuple[Post, ...] = ()
-    name: str = 'dict'
-    unhandled_ok: bool = False
+    __slots__ = (
+        'value_key_specs',
+        'type_key_specs',
+        'post',
+        'name',
+        'unhandled_ok',
+        'fail_fast',
+        '_value_key_records',
+        '_value_keys',
+        '_type_key_records',
+        '_type_key_map',
+        '_post_evaluators',
+        '_keys_must_be',
+        '_fast_path_ok',
+    )
+    value_key_specs: Tuple[DictItemTuple, ...]
+    type_key_specs: Tuple[DictItemTuple, ...]
+    post: Tuple[Post, ...]
+    name: str
+    unhandled_ok: bool
+    fail_fast: bool
 
     _hash_props: Tuple[str] = (
         'value_key_specs',
@@ -520,7 +1088,8 @@ class DictSpec(Spec):
                  default: Any = dict,
                  is_unset: Validator = simple_is_unset,
                  constraints: Constraints = None,
-                 auto_optional: bool = False):
+                 auto_optional: bool = False,
+                 fail_fast: bool = False):
         """
         ---
         schema: |
@@ -560,6 +1129,9 @@ class DictSpec(Spec):
         auto_optional: |
             Set to True to make the `DictSpec` optional if all value keys are optional or if there are only
             type keys, and auto-generate a default dict where all value keys are set to their default value.
+        fail_fast: |
+            Set to True to raise on the first failure instead of collecting a message for every invalid key. Useful
+            when only validity matters, e.g. for large or frequently-invalid inputs.
         """
 
         if schema:
@@ -570,18 +1142,35 @@ class DictSpec(Spec):
             if not value_key_specs and not type_key_specs:
                 raise BadSchemaError('One of schema or value_key_specs/type_key_specs must be specified')
 
-        for _, spec in type_key_specs:
+        self.value_key_specs = tuple(value_key_specs) if value_key_specs else ()
+        self.type_key_specs = tuple(type_key_specs) if type_key_specs else ()
+        self.post = tuple(post) if post else ()
+        self.name = name
+        self.unhandled_ok = unhandled_ok
+        self.fail_fast = fail_fast
+
+        for _, spec in self.type_key_specs:
             if isinstance(spec, ConditionalDictSpec):
                 raise BadSchemaError('type keys may not use ConditionalDictSpec')
 
-        if value_key_specs:
-            self.value_key_specs = tuple(value_key_specs)
-        if type_key_specs:
-            self.type_key_specs = tuple(type_key_specs)
-        if post:
-            self.post = tuple(post)
-        self.name = name
-        self.unhandled_ok = unhandled_ok
+        self._value_key_records = tuple(
+            self._value_key_record(key, spec) for key, spec in self.value_key_specs
+        )
+        try:
+            self._value_keys = frozenset(key for key, _ in self.value_key_specs)
+        except TypeError:
+            raise BadSchemaError('DictSpec value keys must be Hashable')
+        if len(self._value_keys) != len(self.value_key_specs):
+            # keys are counted off as they are handled, which only works when each one is distinct, e.g. not 1 and True
+            keys = repr_seq_str(self.value_key_specs, key=lambda i: i[0])
+            raise BadSchemaError(f'DictSpec value keys must be distinct, got {keys}')
+        self._type_key_records = tuple(
+            self._type_key_record(type_key, spec) for type_key, spec in self.type_key_specs
+        )
+        self._type_key_map = self._build_type_key_map(self._type_key_records)
+        self._post_evaluators = tuple(post.evaluate for post in self.post)
+        self._keys_must_be = None
+        self._fast_path_ok = all(check is not None for _, _, check, _, _ in self._value_key_records)
 
         if auto_optional:
             if optional or default is not dict:
@@ -598,6 +1187,175 @@ class DictSpec(Spec):
 
         Spec.__init__(self, optional, default, is_unset, constraints)
 
+    @staticmethod
+    def _value_key_record(key: Hashable, spec: DictSpecValue) -> ValueKeyRecord:
+        """Get the (key, spec, check, optional, c_default) record used to check a value key during validation
+
+        `check` is None for a ConditionalDictSpec, which is checked against the whole mapping instead.
+
+        `c_default` is the checked default value to use for a missing optional key when it can safely be shared
+        between mappings, otherwise `_MISSING` and the default is checked on every use. Only immutable defaults that
+        the Spec leaves unchanged are shared, since a canonicalize function -- like a callable default or an overridden
+        `default()` -- may not give the same result every time.
+        """
+        if isinstance(spec, ConditionalDictSpec):
+            return key, spec, None, spec.optional, _MISSING
+        optional = isinstance(spec, Spec) and spec.optional
+        c_spec = canonicalize_base_type(spec)
+        c_default = _MISSING
+        if optional and not spec._default_is_callable and type(spec).default is Spec.default:
+            d_value = spec.default()
+            try:
+                c_value = spec.check_value(d_value)
+            except InvalidValueError as e:
+                raise BadSchemaError(f'Invalid schema, default value for key {key!r} is spec-invalid: {e}')
+            canonicalizes = getattr(spec, '_canonicalize', None) or getattr(spec, '_canonicalize_overridden', False)
+            if c_value is d_value and not canonicalizes and _is_immutable_default(c_value):
+                c_default = c_value
+        return key, c_spec, get_value_checker(c_spec), optional, c_default
+
+    @staticmethod
+    def _type_key_record(type_key: Types, spec: Types) -> Tuple[Any, Optional[ValueChecker], ValueChecker]:
+        """Get the (type_key, key_check, value_check) record used to check a type key during validation
+
+        `key_check` is None for a plain type, which is matched with isinstance() rather than by catching the checker's
+        exception, since most keys tried against a type key do not match it.
+        """
+        type_key = canonicalize_base_type(type_key)
+        key_check = None if isinstance(type_key, type) else get_value_checker(type_key)
+        return type_key, key_check, get_value_checker(canonicalize_base_type(spec))
+
+    @staticmethod
+    def _build_type_key_map(type_key_records) -> Dict[type, ValueChecker]:
+        """Map plain type keys to their value_check so keys of exactly that type skip the ordered search
+
+        A type is only included if no earlier type key could also match a key of exactly that type, so that the first
+        matching type key still wins.
+        """
+        type_key_map = {}
+        earlier_types = []
+        for type_key, _, value_check in type_key_records:
+            if not isinstance(type_key, type):
+                break
+            if type_key not in type_key_map and not any(issubclass(type_key, t) for t in earlier_types):
+                type_key_map[type_key] = value_check
+            earlier_types.append(type_key)
+        return type_key_map
+
+    def _check_value_fast(self, mapping: Mapping) -> dict:
+        """Check a mapping against a DictSpec without a ConditionalDictSpec, which needs the full checker's state
+
+        At the first failure, the partly checked mapping is handed to the full checker, which continues from there to
+        collect the remaining failure messages. Nothing is checked twice, so nested DictSpecs are each checked once.
+        """
+        get = mapping.get
+        c_mapping = {}
+        handled_count = 0
+        for record in self._value_key_records:
+            key, spec, check, optional, c_default = record
+            value = get(key, _MISSING)
+            if value is _MISSING:
+                if not optional:
+                    checker = self._DictSpecValueChecker.resume(self, mapping, c_mapping, handled_count)
+                    checker._add_failure(('Missing required mapping key {!r}', key))
+                    checker._check_value_key_specs(self._records_after(record))
+                    return checker.check_remaining(self, self.unhandled_ok)
+                if c_default is not _MISSING:
+                    c_mapping[key] = c_default
+                else:
+                    c_mapping[key] = spec.check_value(spec.default())
+                continue
+            handled_count += 1
+            try:
+                c_mapping[key] = check(value)
+            except InvalidValueError as e:
+                checker = self._DictSpecValueChecker.resume(self, mapping, c_mapping, handled_count)
+                checker._add_failure(('Invalid value for key {!r}: {}', key, e))
+                checker._check_value_key_specs(self._records_after(record))
+                return checker.check_remaining(self, self.unhandled_ok)
+        if handled_count != len(mapping):
+            if self._type_key_records:
+                self._check_type_keys_fast(mapping, c_mapping, handled_count)
+            elif not self.unhandled_ok:
+                checker = self._DictSpecValueChecker.resume(self, mapping, c_mapping, handled_count)
+                return checker.check_remaining(self, False)
+        if self._post_evaluators:
+            evaluators = iter(self._post_evaluators)
+            for evaluate in evaluators:
+                try:
+                    evaluate(c_mapping)
+                except InvalidValueError as e:
+                    checker = self._DictSpecValueChecker.resume(self, mapping, c_mapping, handled_count)
+                    checker._add_failure(('{}', e), 'Post processing has failed')
+                    checker._post_processing(evaluators)
+        return c_mapping
+
+    def _records_after(self, record: ValueKeyRecord) -> Tuple[ValueKeyRecord, ...]:
+        """Get the value key records after `record`, for the full checker to continue from"""
+        records = self._value_key_records
+        for i, r in enumerate(records):
+            if r is record:
+                return records[i + 1:]
+        return ()
+
+    def _check_type_keys_fast(self, mapping: Mapping, c_mapping: dict, handled_count: int) -> None:
+        """Add the items of `mapping` that are not value keys to `c_mapping` by type key
+
+        As with the value keys, the full checker takes over from the first failure, and raises for it.
+        """
+        value_keys = self._value_keys
+        type_key_map = self._type_key_map
+        for key, value in mapping.items():
+            if key in value_keys:
+                continue
+            try:
+                value_check = type_key_map.get(type(key))
+                if value_check is not None:
+                    c_mapping[key] = value_check(value)
+                    continue
+                for type_key, key_check, value_check in self._type_key_records:
+                    if key_check is None:
+                        if not isinstance(key, type_key):
+                            continue
+                        c_key = key
+                    else:
+                        try:
+                            c_key = key_check(key)
+                        except InvalidValueError:
+                            continue
+                    c_mapping[c_key] = value_check(value)
+                    break
+                else:
+                    if not self.unhandled_ok:
+                        unhandled_keys = [key]
+                        failure = None
+                        break
+            except InvalidValueError as e:
+                unhandled_keys = []
+                failure = ('Value for key {!r} does not conform with spec: {}', key, e)
+                break
+        else:
+            return
+        checker = self._DictSpecValueChecker.resume(self, mapping, c_mapping, handled_count)
+        if failure is not None:
+            checker._add_failure(failure)
+        items = iter(mapping.items())
+        for item_key, _ in items:
+            if item_key is key or item_key == key:
+                break
+        remaining_items = [item for item in items if item[0] not in value_keys]
+        unhandled_keys += checker._check_type_key_specs(self, remaining_items)
+        checker.check_remaining(self, self.unhandled_ok, unhandled_keys)
+
+    def _get_keys_must_be(self) -> str:
+        """Get the message listing the valid keys, built on first use since only invalid mappings need it"""
+        if self._keys_must_be is None:
+            all_keys = []
+            self._DictSpecValueChecker._add_keys(all_keys, self.value_key_specs)
+            self._DictSpecValueChecker._add_keys(all_keys, self.type_key_specs)
+            self._keys_must_be = must_be_msg(all_keys)
+        return self._keys_must_be
+
     def _auto_optional(self):
         default_dict = {}
         for value_key, spec in self.value_key_specs:
@@ -614,10 +1372,9 @@ class DictSpec(Spec):
         value_key_specs = []
         type_key_specs = []
         for key, spec in schema.items():
-            try:
-                type_key = canonicalize_base_type(key)
-                type_key_specs.append((type_key, spec))
-            except BadSchemaError:
+            if _is_base_type_key(key):
+                type_key_specs.append((canonicalize_base_type(key), spec))
+            else:
                 value_key_specs.append((key, spec))
         return value_key_specs, type_key_specs
 
@@ -625,77 +1382,133 @@ class DictSpec(Spec):
         return self.name
 
     def _check_value(self, mapping):
-        if not isinstance(mapping, abc.Mapping):
+        if type(mapping) is not dict and not isinstance(mapping, abc.Mapping):
             raise InvalidValueNoTypeMatch('Must be mapping/dict')
 
-        return self._DictSpecValueChecker(mapping).check_dict_spec(self, self.unhandled_ok)
+        if self._fast_path_ok:
+            return self._check_value_fast(mapping)
+
+        return self._DictSpecValueChecker(mapping, self.fail_fast).check_dict_spec(self, self.unhandled_ok)
 
     class _DictSpecValueChecker:
-        def __init__(self, mapping):
+        __slots__ = ('mapping', 'fail_fast', 'c_mapping', 'failure_messages', 'handled_count', 'value_keys', 'nested')
+
+        def __init__(self, mapping, fail_fast=False):
             self.mapping = mapping
+            self.fail_fast = fail_fast
             self.c_mapping = {}
             self.failure_messages = []
-            self.unhandled_keys = set(mapping.keys())
-
-        def _check_dict_spec_value(self, spec, value):
-            if isinstance(spec, ConditionalDictSpec):
-                return spec.check_value(self, value)
-            else:
-                return check_value_base_type(spec, value)
-
-        def _check_value_key_specs(self, dict_spec):
-            for key, spec in dict_spec.value_key_specs:
+            self.handled_count = 0
+            self.value_keys = None
+            self.nested = False
+
+        @classmethod
+        def resume(cls, dict_spec: DictSpec, mapping: Mapping, c_mapping: dict, handled_count: int):
+            """Get a checker to continue checking `mapping` where `DictSpec._check_value_fast` found a failure"""
+            checker = cls(mapping, dict_spec.fail_fast)
+            checker.c_mapping = c_mapping
+            checker.handled_count = handled_count
+            checker.value_keys = dict_spec._value_keys
+            return checker
+
+        def _remaining_items(self) -> List[Tuple[Hashable, Any]]:
+            # Only keys present in the mapping are counted, so a matching count means every key was a value key.
+            # A conditional sub-spec shares this checker and may repeat a key, so then the count is not trusted.
+            if self.handled_count == len(self.mapping) and not self.nested:
+                return []
+            mapping = self.mapping
+            value_keys = self.value_keys
+            if type(mapping) is dict:
+                # the set difference runs in C, and a single leftover key needs no pass in mapping order to keep
+                # messages stable
+                extra_keys = mapping.keys() - value_keys
+                if len(extra_keys) <= 1:
+                    return [(key, mapping[key]) for key in extra_keys]
+            return [item for item in mapping.items() if item[0] not in value_keys]
+
+        def _add_failure(self, message: FailureMessage, header: str = 'Does not conform with dict schema'):
+            self.failure_messages.append(message)
+            if self.fail_fast:
+                raise InvalidValueError(header, self.failure_messages)
+
+        def _check_value_key_specs(self, records: Iterable[ValueKeyRecord]):
+            # runs once per value key of every mapping checked, so attribute lookups are hoisted into locals
+            get = self.mapping.get
+            c_mapping = self.c_mapping
+            handled_count = 0
+            for key, spec, check, optional, c_default in records:
+                value = get(key, _MISSING)
+                if value is _MISSING:
+                    if not optional:
+                        self._add_failure(('Missing required mapping key {!r}', key))
+                    elif c_default is not _MISSING:
+                        c_mapping[key] = c_default
+                    elif check is None:
+                        c_mapping[key] = spec.default(self)
+                    else:
+                        c_mapping[key] = spec.check_value(spec.default())
+                    continue
+                handled_count += 1
                 try:
-                    self.unhandled_keys.remove(key)
-                    value = self.mapping[key]
-                    self.c_mapping[key] = self._check_dict_spec_value(spec, value)
-                except KeyError:
-                    if isinstance(spec, Spec) and spec.optional:
-                        d_value = spec.default()
-                        self.c_mapping[key] = spec.check_value(d_value)
-                    elif isinstance(spec, ConditionalDictSpec) and spec.optional:
-                        self.c_mapping[key] = spec.default(self)
+                    if check is None:
+                        c_mapping[key] = spec.check_value(self, value)
                     else:
-                        self.failure_messages.append(f'Missing required mapping key {key!r}')
+                        c_mapping[key] = check(value)
                 except InvalidValueError as e:
-                    self.failure_messages.append(f'Invalid value for key {key!r}: {e}')
+                    self._add_failure(('Invalid value for key {!r}: {}', key, e))
+            self.handled_count += handled_count
 
         def _check_type_key_spec(self, dict_spec, key, value):
-            for type_key, spec in dict_spec.type_key_specs:
+            value_check = dict_spec._type_key_map.get(type(key))
+            if value_check is not None:
                 try:
-                    c_key = check_value_base_type(type_key, key)
-                except InvalidValueError:
-                    continue
+                    return key, value_check(value)
+                except InvalidValueError as e:
+                    raise InvalidValueError(f'Value for key {key!r} does not conform with spec: {e}')
+            for type_key, key_check, value_check in dict_spec._type_key_records:
+                if key_check is None:
+                    if not isinstance(key, type_key):
+                        continue
+                    c_key = key
+                else:
+                    try:
+                        c_key = key_check(key)
+                    except InvalidValueError:
+                        continue
                 try:
-                    c_value = self._check_dict_spec_value(spec, value)
+                    c_value = value_check(value)
                     return c_key, c_value
                 except InvalidValueError as e:
                     raise InvalidValueError(f'Value for key {key!r} does not conform with spec: {e}')
             raise InvalidValueNoTypeMatch('No match for dict type keys')
 
-        def _check_type_key_specs(self, dict_spec):
-            if self.unhandled_keys and dict_spec.type_key_specs:
-                for key in list(self.unhandled_keys):
-                    value = self.mapping[key]
-                    try:
-                        c_key, c_value = self._check_type_key_spec(dict_spec, key, value)
-                        self.unhandled_keys.remove(key)
-                        self.c_mapping[c_key] = c_value
-                    except InvalidValueNoTypeMatch:
-                        pass
-                    except InvalidValueError as e:
-                        self.failure_messages.append(str(e))
-                        self.unhandled_keys.remove(key)
-
-        def _post_processing(self, dict_spec: DictSpec):
-            for post in dict_spec.post:
+        def _check_type_key_specs(self, dict_spec, items: List[Tuple[Hashable, Any]]) -> List[Hashable]:
+            unhandled_keys = []
+            c_mapping = self.c_mapping
+            check_type_key_spec = self._check_type_key_spec
+            for key, value in items:
                 try:
-                    post.evaluate(self.c_mapping)
+                    c_key, c_value = check_type_key_spec(dict_spec, key, value)
+                    c_mapping[c_key] = c_value
+                except InvalidValueNoTypeMatch:
+                    unhandled_keys.append(key)
                 except InvalidValueError as e:
-                    self.failure_messages.append(str(e))
+                    self._add_failure(('{}', e))
+            return unhandled_keys
+
+        def _post_processing(self, evaluators: Iterable[Callable[[dict], None]]):
+            for evaluate in evaluators:
+                try:
+                    evaluate(self.c_mapping)
+                except InvalidValueError as e:
+                    self._add_failure(('{}', e), 'Post processing has failed')
             if self.failure_messages:
                 raise InvalidValueError('Post processing has failed', self.failure_messages)
 
+        @staticmethod
+        def _unhandled_keys_msg(unhandled_keys: List[Hashable], dict_spec: DictSpec) -> str:
+            return f'Keys {repr_seq_str(unhandled_keys)} are unhandled; valid keys {dict_spec._get_keys_must_be()}'
+
         @staticmethod
         def _add_keys(all_keys, key_specs):
             for key, _ in key_specs:
@@ -706,20 +1519,33 @@ class DictSpec(Spec):
                     raise BadSchemaError(f'DictSpec key {key!r} is not Hashable')
 
         def check_dict_spec(self, dict_spec: DictSpec, unhandled_ok: bool):
-            self._check_value_key_specs(dict_spec)
-            self._check_type_key_specs(dict_spec)
-
-            if not unhandled_ok and self.unhandled_keys:
-                unhandled_keys = repr_seq_str(self.unhandled_keys)
-                all_keys = []
-                self._add_keys(all_keys, dict_spec.value_key_specs)
-                self._add_keys(all_keys, dict_spec.type_key_specs)
-                keys_must_be = must_be_msg(all_keys)
-                self.failure_messages.append(f'Keys {unhandled_keys} are unhandled; valid keys {keys_must_be}')
+            if self.value_keys is None:
+                self.value_keys = dict_spec._value_keys
+            else:
+                self.value_keys = self.value_keys | dict_spec._value_keys
+                self.nested = True
+            self._check_value_key_specs(dict_spec._value_key_records)
+            return self.check_remaining(dict_spec, unhandled_ok)
+
+        def check_remaining(self, dict_spec: DictSpec, unhandled_ok: bool,
+                            unhandled_keys: Optional[List[Hashable]] = None):
+            """Check what is left of the mapping once the value keys are checked
+
+            `unhandled_keys` may be passed if the type keys have already been checked
+            """
+            if unhandled_keys is None and (dict_spec._type_key_records or not unhandled_ok):
+                remaining_items = self._remaining_items()
+                if remaining_items and dict_spec._type_key_records:
+                    unhandled_keys = self._check_type_key_specs(dict_spec, remaining_items)
+                else:
+                    unhandled_keys = [key for key, _ in remaining_items]
+
+            if unhandled_keys and not unhandled_ok:
+                self.failure_messages.append((self._unhandled_keys_msg, unhandled_keys, dict_spec))
 
             if self.failure_messages:
                 raise InvalidValueError('Does not conform with dict schema', self.failure_messages)
 
-            self._post_processing(dict_spec)
+            self._post_processing(dict_spec._post_evaluators)
 
             return self.c_mapping
@@ -1,5 +1,7 @@
 """User-facing utility functions"""
 from __future__ import annotations
+import operator
+from functools import lru_cache, partial, wraps
 from typing import Any
 
 from .specs import (
@@ -13,55 +15,105 @@ from .base import Constraint
 # "generics"
 
 
+# Specs are not modified after construction, so every use of e.g. list_or_single(str) can share one TypeSpec
+@lru_cache(maxsize=128)
 def list_or_single(t: SimpleType) -> TypeSpec:
     return TypeSpec((IterSpec(t), Type(t, lambda v: [v])))
 
 
 # constraint factories
+# Factories taking only lengths are memoized, so e.g. every minlen(3) is the same Constraint, and Specs built with it
+# share the validator and message, hash equally, and can be interned together
 
 
+@lru_cache(maxsize=None)
 def minlen(length: int) -> Constraint:
     def check_length(value: Any) -> bool:
         return len(value) >= length
     return check_length, f'Must have length >= {length}'
 
 
+@lru_cache(maxsize=None)
 def maxlen(length: int) -> Constraint:
     def check_length(value: Any) -> bool:
         return len(value) <= length
     return check_length, f'Must have length <= {length}'
 
 
+@lru_cache(maxsize=None)
 def range_len(min_len: int, max_len: int) -> Constraint:
     def check_length(value: Any) -> bool:
         return min_len <= len(value) <= max_len
     return check_length, f'Must have length between {min_len}-{max_len}'
 
 
+@lru_cache(maxsize=None)
 def exact_len(length: int) -> Constraint:
     def check_length(value: Any) -> bool:
         return len(value) == length
     return check_length, f'Must have exact length {length}'
 
 
+# Factories taking arbitrary values cache a bounded number of them, keyed by type too so e.g. min_value(1) and
+# min_value(True) keep their own messages. Unhashable values get a new Constraint every time
+
+
+def _cached_factory(factory):
+    cached = lru_cache(maxsize=256, typed=True)(factory)
+
+    @wraps(factory)
+    def get_constraint(*args) -> Constraint:
+        try:
+            return cached(*args)
+        except TypeError:
+            return factory(*args)
+    return get_constraint
+
+
+# Bound types whose comparison methods defer to the other operand for anything but their own builtin kind, so swapping
+# the operands of a comparison against them cannot change its result
+_builtin_scalar_types = frozenset((int, float, str, bytes))
+
+
+@_cached_factory
+def equals(test_value: Any) -> Constraint:
+    if type(test_value) in _builtin_scalar_types:
+        return partial(operator.eq, test_value), f'Must equal {test_value!r}'
+
+    def check_equals(value: Any) -> bool:
+        return value == test_value
+    return check_equals, f'Must equal {test_value!r}'
+
+
+@_cached_factory
 def contains(test_value: Any) -> Constraint:
     def check_contains(value: Any) -> bool:
         return test_value in value
     return check_contains, f'Must contain {test_value!r}'
 
 
+@_cached_factory
 def min_value(min_val: Any) -> Constraint:
+    if type(min_val) in _builtin_scalar_types:
+        # `min_val <= value` is `value >= min_val` for a builtin scalar bound, and checks in C without a Python frame
+        return partial(operator.le, min_val), f'Must be >= {min_val!r}'
+
     def check_value(value: Any) -> bool:
         return value >= min_val
     return check_value, f'Must be >= {min_val!r}'
 
 
+@_cached_factory
 def max_value(max_val: Any) -> Constraint:
+    if type(max_val) in _builtin_scalar_types:
+        return partial(operator.ge, max_val), f'Must be <= {max_val!r}'
+
     def check_value(value: Any) -> bool:
         return value <= max_val
     return check_value, f'Must be <= {max_val!r}'
 
 
+@_cached_factory
 def range_value(min_val: Any, max_val: Any) -> Constraint:
     def check_value(value: Any) -> bool:
         return min_val <= value <= max_val
@@ -1,6 +1,9 @@
 import dataschema
+from dataschema import common, utils
 
+import pickle
 import unittest
+from array import array
 
 typical_data_types = (
     (str, "a string", 5),
@@ -75,6 +78,13 @@ class TestDataSchema(unittest.TestCase):
                                 constraints=(lambda v: v.startswith('x'), 'Must start with x'),
                                 optional=True)
 
+        with self.subTest('Constraints apply to the checked default'):
+            t = dataschema.IterSpec(dataschema.Type(int, canonicalize=lambda v: v * 10),
+                                    optional=True,
+                                    default=(1,),
+                                    constraints=(lambda l: l[0] >= 10, 'Must start with a value >= 10'))
+            self.assertEqual(t.check_value(None), [10])
+
     def test_type_callable_default(self):
         t = dataschema.Type(dict, default=dict, optional=True)
         v1 = t.check_value(None)
@@ -83,6 +93,35 @@ class TestDataSchema(unittest.TestCase):
         self.assertEqual(v1, v2)
         self.assertIsNot(v1, v2)
 
+    def test_subclass_default_override(self):
+        counter = iter(range(100))
+
+        class Counter(dataschema.Type):
+            __slots__ = ()
+
+            def default(self):
+                return next(counter)
+
+        class CounterEnum(dataschema.EnumSpec):
+            __slots__ = ()
+
+            def default(self):
+                return next(counter)
+
+        class CounterSeq(dataschema.SeqSpec):
+            __slots__ = ()
+
+            def default(self):
+                return (next(counter),)
+
+        for name, t in (('Type', Counter(int, optional=True, default=0)),
+                        ('EnumSpec', CounterEnum(range(100), optional=True, default=0)),
+                        ('Spec', CounterSeq((int,), optional=True, default=(0,)))):
+            with self.subTest(f'Check an overridden default is used ({name})'):
+                self.assertNotEqual(t.check_value(None), t.check_value(None))
+                d = dataschema.DictSpec({'x': t})
+                self.assertNotEqual(d.check_value({}), d.check_value({}))
+
     def test_type_spec(self):
         t = dataschema.TypeSpec(types=(int, dataschema.Type(str, lambda s: 5), None),
                                 default=5,
@@ -110,6 +149,64 @@ class TestDataSchema(unittest.TestCase):
             with self.assertRaises(dataschema.InvalidValueError):
                 t.check_value(bad_value)
 
+        t = dataschema.TypeSpec(types=(dataschema.Type(int, str), int, float))
+        with self.subTest('Test earlier Spec takes precedence over a later plain type'):
+            self.assertEqual(t.check_value(5), '5')
+            self.assertEqual(t.check_value(4.2), 4.2)
+
+        t = dataschema.TypeSpec(types=(dataschema.Type(int, optional=True, default=5), str))
+        with self.subTest('Test earlier optional Type takes precedence for unset values of another type'):
+            self.assertEqual(t.check_value(''), 5)
+            self.assertEqual(t.check_value('x'), 'x')
+
+        t = dataschema.TypeSpec(types=(dataschema.EnumSpec(('a',), canonicalize=str.upper), int))
+        with self.subTest('Test EnumSpec members of a union'):
+            self.assertEqual(t.check_value('a'), 'A')
+            self.assertEqual(t.check_value(5), 5)
+            with self.assertRaises(dataschema.InvalidValueError):
+                t.check_value(['a'])
+
+    def test_type_subclass_check_value_hook(self):
+        class LooseInt(dataschema.Type):
+            __slots__ = ()
+
+            def _check_value(self, value):
+                if isinstance(value, str) and value.isdigit():
+                    return int(value)
+                return dataschema.Type._check_value(self, value)
+
+        with self.subTest('Check an overridden _check_value is used by Type.check_value'):
+            self.assertEqual(LooseInt(int).check_value('5'), 5)
+            self.assertEqual(dataschema.IterSpec(LooseInt(int)).check_value(['5', 6]), [5, 6])
+            with self.assertRaises(dataschema.InvalidValueError):
+                LooseInt(int).check_value('x')
+
+        with self.subTest('Check an overridden _check_value is used for a union member'):
+            t = dataschema.TypeSpec((LooseInt(int), float))
+            self.assertEqual(t.check_value('5'), 5)
+            self.assertEqual(t.check_value(4.2), 4.2)
+            self.assertEqual(dataschema.IterSpec((LooseInt(int), float)).check_value(['5', 4.2]), [5, 4.2])
+
+    def test_subclass_canonicalize_override(self):
+        class Upper(dataschema.Type):
+            __slots__ = ()
+
+            def canonicalize(self, value):
+                return value.upper()
+
+        class UpperEnum(dataschema.EnumSpec):
+            __slots__ = ()
+
+            def canonicalize(self, value):
+                return value.upper()
+
+        for name, t in (('Type', Upper(str)), ('EnumSpec', UpperEnum(('a',)))):
+            with self.subTest(f'Check an overridden canonicalize is used without a canonicalize callable ({name})'):
+                self.assertEqual(t.check_value('a'), 'A')
+                self.assertEqual(dataschema.IterSpec(t).check_value(['a']), ['A'])
+                self.assertEqual(dataschema.SeqSpec((t,)).check_value(['a']), ('A',))
+                self.assertEqual(dataschema.DictSpec({'x': t}).check_value({'x': 'a'}), {'x': 'A'})
+
     def test_enum_spec(self):
         test_values = ("a string", 5, 6.4, complex(5, 4), frozenset('xyz'))
         t = dataschema.EnumSpec(values=test_values)
@@ -119,9 +216,292 @@ class TestDataSchema(unittest.TestCase):
                 c_value = t.check_value(v)
                 self.assertEqual(c_value, v)
 
-        bad_values = ("another string", 6, 7.5, complex(6, 5), set('abc'))
+        bad_values = ("another string", 6, 7.5, complex(6, 5), set('abc'), ['unhashable'])
 
         for v in bad_values:
             with self.subTest(f'Check bad enum value {repr(v)}'):
                 with self.assertRaises(dataschema.InvalidValueError):
                     t.check_value(v)
+
+    def test_enum_spec_canonicalize(self):
+        t = dataschema.EnumSpec(values=(1, 'a'), canonicalize=repr)
+        for _ in range(2):
+            with self.subTest('Check equal values of different types canonicalize separately'):
+                self.assertEqual(t.check_value(1), '1')
+                self.assertEqual(t.check_value(True), 'True')
+
+        t = dataschema.EnumSpec(values=('a',), canonicalize=lambda v: [v])
+        with self.subTest('Check unhashable results are not shared'):
+            self.assertEqual(t.check_value('a'), ['a'])
+            self.assertIsNot(t.check_value('a'), t.check_value('a'))
+
+        class Box:
+            def __init__(self, value):
+                self.value = value
+
+        t = dataschema.EnumSpec(values=('a',), canonicalize=Box)
+        with self.subTest('Check mutable hashable results are not shared'):
+            self.assertIsNot(t.check_value('a'), t.check_value('a'))
+
+    def test_enum_spec_subclass_check_value_hook(self):
+        class CaselessEnum(dataschema.EnumSpec):
+            __slots__ = ()
+
+            def _check_value(self, value):
+                return dataschema.EnumSpec._check_value(self, value.lower() if isinstance(value, str) else value)
+
+        with self.subTest('Check an overridden _check_value is used by EnumSpec.check_value'):
+            self.assertEqual(CaselessEnum(('a',)).check_value('A'), 'a')
+            with self.assertRaises(dataschema.InvalidValueError):
+                CaselessEnum(('a',)).check_value('B')
+            self.assertEqual(dataschema.TypeSpec((CaselessEnum(('a',)), int)).check_value('A'), 'a')
+
+    def test_dict_spec_canonicalized_default(self):
+        counter = iter(range(100))
+        t = dataschema.DictSpec({
+            'id': dataschema.Type(str, optional=True, default='', canonicalize=lambda v: v or str(next(counter))),
+            'ids': dataschema.TypeSpec((dataschema.Type(str, lambda v: v or str(next(counter))),), optional=True,
+                                       default=''),
+        })
+        with self.subTest('Check a canonicalized default is canonicalized for every mapping'):
+            first, second = t.check_value({}), t.check_value({})
+            self.assertNotEqual(first['id'], second['id'])
+            self.assertNotEqual(first['ids'], second['ids'])
+
+    def test_dict_spec_duplicate_value_keys(self):
+        for name, value_key_specs in (('Same key twice', [('a', int), ('a', int)]),
+                                      ('Equal keys', [(1, int), (True, int)])):
+            with self.subTest(name):
+                with self.assertRaises(dataschema.BadSchemaError):
+                    dataschema.DictSpec(value_key_specs=value_key_specs)
+
+    def test_fail_fast(self):
+        bad_list = [1, 'a', 2, 'b']
+        bad_dict = {'a': 'x', 'b': 'y'}
+        with self.subTest('Check all failures are collected by default'):
+            with self.assertRaises(dataschema.InvalidValueError) as cm:
+                dataschema.IterSpec(int).check_value(bad_list)
+            self.assertEqual(cm.exception.error_count, 2)
+            with self.assertRaises(dataschema.InvalidValueError) as cm:
+                dataschema.DictSpec({'a': int, 'b': int}).check_value(bad_dict)
+            self.assertEqual(cm.exception.error_count, 2)
+
+        with self.subTest('Check fail_fast stops at the first failure'):
+            with self.assertRaises(dataschema.InvalidValueError) as cm:
+                dataschema.IterSpec(int, fail_fast=True).check_value(bad_list)
+            self.assertEqual(cm.exception.error_count, 1)
+            with self.assertRaises(dataschema.InvalidValueError) as cm:
+                dataschema.DictSpec({'a': int, 'b': int}, fail_fast=True).check_value(bad_dict)
+            self.assertEqual(cm.exception.error_count, 1)
+            constraints = ((lambda v: v > 5, 'Must be > 5'), (lambda v: v % 2, 'Must be odd'))
+            with self.assertRaises(dataschema.InvalidValueError) as cm:
+                dataschema.Type(int, constraints=constraints, fail_fast=True).check_value(2)
+            self.assertEqual(cm.exception.error_count, 1)
+
+        with self.subTest('Check fail_fast is kept by copy'):
+            self.assertTrue(dataschema.IterSpec(int, fail_fast=True).copy().fail_fast)
+            self.assertTrue(dataschema.DictSpec({'a': int}, fail_fast=True).copy().fail_fast)
+            self.assertTrue(dataschema.Type(int, fail_fast=True).copy().fail_fast)
+            self.assertNotEqual(hash(dataschema.Type(int, fail_fast=True)), hash(dataschema.Type(int)))
+
+        class IntType(dataschema.Type):
+            __slots__ = ()
+
+            def __init__(self, base_type=int, canonicalize=None, optional=False, default=None,
+                         is_unset=dataschema.base.default_is_unset, constraints=None):
+                dataschema.Type.__init__(self, base_type, canonicalize, optional, default, is_unset, constraints)
+
+        with self.subTest('Check subclasses not accepting fail_fast can still be copied'):
+            self.assertIsInstance(IntType().copy(), IntType)
+            t = IntType().add_constraints((lambda v: v > 0, 'Must be positive'))
+            self.assertIsInstance(t, IntType)
+            with self.assertRaises(dataschema.InvalidValueError):
+                t.check_value(0)
+
+    def test_iter_spec_array(self):
+        with self.subTest('Check typed arrays of an allowed type'):
+            self.assertEqual(dataschema.IterSpec(int).check_value(array('q', [1, 2])), [1, 2])
+            self.assertEqual(dataschema.IterSpec((int, float)).check_value(array('d', [1.5])), [1.5])
+
+        with self.subTest('Check typed arrays of another type'):
+            with self.assertRaises(dataschema.InvalidValueError):
+                dataschema.IterSpec(int).check_value(array('d', [1.5]))
+
+    def test_iter_spec_constrained_type(self):
+        t = dataschema.IterSpec(dataschema.Type(int, constraints=(lambda v: v > 0, 'Must be positive')))
+        with self.subTest('Check elements meeting the constraints'):
+            self.assertEqual(t.check_value((1, 2)), [1, 2])
+
+        with self.subTest('Check each element failing a constraint is reported'):
+            with self.assertRaises(dataschema.InvalidValueError) as cm:
+                t.check_value([1, 0, -1])
+            self.assertEqual(cm.exception.error_count, 2)
+
+    def test_constraint_factories(self):
+        t = dataschema.Type(int, constraints=(utils.min_value(1), utils.max_value(9), utils.equals(5)))
+        with self.subTest('Check a value meeting every factory constraint'):
+            self.assertEqual(t.check_value(5), 5)
+
+        for bad_value in (0, 10, 4):
+            with self.subTest(f'Check factory constraint failure for {bad_value!r}'):
+                with self.assertRaises(dataschema.InvalidValueError):
+                    t.check_value(bad_value)
+
+        with self.subTest('Check factories share Constraints for equal arguments of the same type'):
+            self.assertIs(utils.equals(5), utils.equals(5))
+            self.assertIsNot(utils.equals(1), utils.equals(True))
+
+    def test_common_specs(self):
+        with self.subTest('Check optional common specs accept None and unset values'):
+            self.assertIsNone(common.optional_bool.check_value(None))
+            self.assertIs(common.optional_bool.check_value(False), False)
+            self.assertIsNone(common.optional_str.check_value(''))
+
+        for word in ('abc', 'a_1', ''):
+            with self.subTest(f'Check word_constraint accepts {word!r}'):
+                self.assertEqual(common.word_str.check_value(word), word)
+
+        for not_word in ('a b', 'abc\n', 'a-b'):
+            with self.subTest(f'Check word_constraint rejects {not_word!r}'):
+                with self.assertRaises(dataschema.InvalidValueError):
+                    common.word_str.check_value(not_word)
+
+    def test_spec_intern(self):
+        with self.subTest('Check equal arguments share an instance'):
+            self.assertIs(dataschema.Type.intern(int, optional=True, default=5),
+                          dataschema.Type.intern(int, default=5, optional=True))
+            self.assertIs(dataschema.TypeSpec.intern((int, str)), dataschema.TypeSpec.intern((int, str)))
+
+        with self.subTest('Check different arguments or classes do not share an instance'):
+            self.assertIsNot(dataschema.Type.intern(int), dataschema.Type.intern(str))
+            self.assertIsNot(dataschema.Type.intern(str), dataschema.CType.intern(str))
+
+        with self.subTest('Check equal arguments of different types do not share an instance'):
+            t = dataschema.Type.intern(int, optional=True, default=1)
+            self.assertIs(dataschema.Type.intern(int, optional=True, default=True).default(), True)
+            self.assertIs(t.default(), 1)
+            dataschema.Type.intern(float, optional=True, default=0.0)
+            with self.assertRaises(dataschema.BadSchemaError):
+                dataschema.Type.intern(float, optional=True, default=0)
+            enum = dataschema.EnumSpec.intern((1, 2))
+            self.assertIsNot(dataschema.EnumSpec.intern((True, 2)), enum)
+            self.assertEqual(dataschema.EnumSpec.intern((True, 2)).type_name(), 'enum=True/2')
+
+        with self.subTest('Check unhashable arguments still construct a Spec'):
+            t = dataschema.IterSpec.intern([int])
+            self.assertEqual(t.check_value([[1]]), [[1]])
+            self.assertIsNot(t, dataschema.IterSpec.intern([int]))
+
+        with self.subTest('Check equal list shorthands share an IterSpec'):
+            t = dataschema.TypeSpec(([int], [int], [str]))
+            self.assertIs(t.types[0], t.types[1])
+            self.assertIsNot(t.types[0], t.types[2])
+
+    def test_error_messages(self):
+        with self.assertRaises(dataschema.InvalidValueError) as cm:
+            dataschema.DictSpec({'a': [int]}).check_value({'a': [1, 'x']})
+        with self.subTest('Check nested failure messages are formatted'):
+            self.assertEqual(cm.exception.messages, ["Invalid value for key 'a': Items do not conform with iterable "
+                                                     "spec:\n-- Index 1 is invalid: Must be int"])
+            self.assertEqual(str(cm.exception), 'Does not conform with dict schema:\n-- ' +
+                             cm.exception.messages[0].replace('\n', '\n   '))
+
+        with self.assertRaises(dataschema.InvalidValueError) as cm:
+            dataschema.Type(int, constraints=(lambda v: v > 0, 'Must be positive')).check_value(0)
+        with self.subTest('Check args holds the formatted message'):
+            self.assertEqual(cm.exception.args, ('Constraint not met (return=False): Must be positive',))
+            self.assertEqual(cm.exception.args, (str(cm.exception),))
+
+        with self.assertRaises(dataschema.InvalidValueError) as cm:
+            dataschema.IterSpec(int).check_value([1, 'x', 'y'])
+        with self.subTest('Check a pickled error keeps its messages'):
+            error = pickle.loads(pickle.dumps(cm.exception))
+            self.assertIs(type(error), dataschema.InvalidValueError)
+            self.assertEqual(error.error_count, 2)
+            self.assertEqual(error.messages, cm.exception.messages)
+            self.assertEqual(str(error), str(cm.exception))
+
+        with self.subTest('Check assigning args replaces the message'):
+            cm.exception.args = ('Replaced',)
+            self.assertEqual(str(cm.exception), 'Replaced')
+            self.assertEqual(str(pickle.loads(pickle.dumps(cm.exception))), 'Replaced')
+
+    def test_nested_failures_check_once(self):
+        calls = []
+        t = dataschema.Type(int, lambda v: calls.append(v) or v)
+        value = 1
+        for _ in range(12):
+            t = dataschema.DictSpec({'a': t, 'b': int})
+            value = {'a': value, 'b': 'not an int'}
+        with self.assertRaises(dataschema.InvalidValueError) as cm:
+            t.check_value(value)
+        with self.subTest('Check each nested value is checked once'):
+            self.assertEqual(calls, [1])
+        with self.subTest('Check every nested failure is reported'):
+            self.assertEqual(str(cm.exception).count('not conform'), 12)
+
+        calls = []
+        counted_int = dataschema.Type(int, lambda v: calls.append(v) or v)
+        t = counted_int
+        value = 1
+        for _ in range(8):
+            t = dataschema.DictSpec({'a': t, str: counted_int})
+            value = {'a': value, 'x': 1, 'y': 'not an int', 'z': 2}
+        with self.subTest('Check each type key value is checked once'):
+            with self.assertRaises(dataschema.InvalidValueError):
+                t.check_value(value)
+            self.assertEqual(len(calls), 17)
+
+        calls = []
+        t = counted_int
+        value = 1
+        for _ in range(8):
+            t = dataschema.DictSpec({'a': t}, post=[
+                dataschema.Update('a', update=lambda a: calls.append(a) or a),
+                dataschema.Test('a', test=lambda a: False, message='Always fails'),
+            ])
+            value = {'a': value}
+        with self.subTest('Check each post processing step is run once'):
+            with self.assertRaises(dataschema.InvalidValueError):
+                t.check_value(value)
+            self.assertEqual(calls, [1, 1])
+
+        for name, make_spec in (('single type', lambda t: dataschema.IterSpec(t)),
+                                ('multiple types', lambda t: dataschema.IterSpec((t, str)))):
+            calls = []
+            t = counted_int
+            value = 1
+            for _ in range(12):
+                t = make_spec(t)
+                value = [value, 2.5]
+            with self.subTest(f'Check each nested iterable element is checked once ({name})'):
+                with self.assertRaises(dataschema.InvalidValueError) as cm:
+                    t.check_value(value)
+                self.assertEqual(calls, [1])
+                self.assertEqual(str(cm.exception).count('not conform'), 12)
+
+        calls = []
+        t = counted_int
+        value = 1
+        for _ in range(12):
+            t = dataschema.SeqSpec((t, int))
+            value = (value, 'not an int')
+        with self.subTest('Check each nested sequence element is checked once'):
+            with self.assertRaises(dataschema.InvalidValueError) as cm:
+                t.check_value(value)
+            self.assertEqual(calls, [1])
+            self.assertEqual(str(cm.exception).count('not conform'), 12)
+
+    def test_spec_slots(self):
+        specs = (
+            dataschema.Type(int),
+            dataschema.CType(int),
+            dataschema.EnumSpec(('a', 'b')),
+            dataschema.TypeSpec((int, str)),
+            dataschema.IterSpec(int),
+            dataschema.SeqSpec((int, str)),
+            dataschema.DictSpec({'a': int, str: int}),
+        )
+        for spec in specs:
+            with self.subTest(f'Check {spec.__class__.__name__} has no instance __dict__'):
+                self.assertFalse(hasattr(spec, '__dict__'))